@@ -30,6 +30,7 @@ class SitRep:
         SitRep.SetupLogging(self)
 
         self.git: Github = Utility.GitLogin(self)
+        self.cache: Dict[str, Any] = Utility.CreateCache(self)
 
         for source in self.config["dataSources"]:
             SitRep.ProcessDataSource(self, source)
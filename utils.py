@@ -1,8 +1,11 @@
 import base64
 import hashlib
 import json
+from collections import OrderedDict
+from math import isfinite
+from threading import Event, Lock
 from time import sleep
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import httpx
 from github import Github, InputFileContent
@@ -15,10 +18,60 @@ from loguru import logger
 class Utility:
     """Utilitarian functions designed for SitRep."""
 
-    def GET(
-        self: Any, url: str, raw: bool = False, isRetry: bool = False
-    ) -> Optional[Union[str, bytes]]:
-        """Perform an HTTP GET request and return its response."""
+    def GET(self: Any, url: str, raw: bool = False) -> Optional[Union[str, bytes]]:
+        """
+        Perform an HTTP GET request and return its response. Responses are
+        cached for the duration of the run and concurrent requests for the
+        same resource share a single in-flight fetch.
+        """
+
+        cache: Dict[str, Any] = self.cache
+        owner: bool = False
+
+        with cache["lock"]:
+            if (body := cache["responses"].get(url)) is not None:
+                cache["responses"].move_to_end(url)
+
+                logger.debug(f"GET {url} (cached)")
+            elif (pending := cache["pending"].get(url)) is None:
+                pending = cache["pending"][url] = {"event": Event(), "body": None}
+                owner = True
+
+        if body is None:
+            if owner is True:
+                try:
+                    if (res := Utility.Fetch(self, url)) is not None:
+                        # Keep only the body and its encoding, the Response
+                        # object holds a decoded copy, request, and headers.
+                        pending["body"] = (res.content, res.encoding)
+
+                    if pending["body"] is not None:
+                        with cache["lock"]:
+                            Utility.CacheResponse(self, url, pending["body"])
+                finally:
+                    # Always clear the in-flight entry and release waiters,
+                    # even if fetching or caching failed.
+                    with cache["lock"]:
+                        cache["pending"].pop(url, None)
+
+                    pending["event"].set()
+            else:
+                logger.debug(f"GET {url} (awaiting in-flight request)")
+
+                pending["event"].wait()
+
+            if (body := pending["body"]) is None:
+                return
+
+        content, encoding = body
+
+        if raw is True:
+            return content
+
+        return content.decode(encoding or "utf-8", errors="replace")
+
+    def Fetch(self: Any, url: str, isRetry: bool = False) -> Optional[Response]:
+        """Perform an HTTP GET request over the network, retrying once."""
 
         logger.debug(f"GET {url}")
 
@@ -27,7 +80,6 @@ class Utility:
         try:
             res: Response = httpx.get(url, follow_redirects=True)
             status = res.status_code
-            data: str = res.text
 
             res.raise_for_status()
         except TimeoutException as e:
@@ -36,7 +88,7 @@ class Utility:
 
                 sleep(10)
 
-                return Utility.GET(self, url, raw, True)
+                return Utility.Fetch(self, url, True)
 
             # TimeoutException is common, no need to log as error
             logger.debug(f"GET {url} failed, {e}")
@@ -48,7 +100,7 @@ class Utility:
 
                 sleep(10)
 
-                return Utility.GET(self, url, raw, True)
+                return Utility.Fetch(self, url, True)
 
             logger.error(f"(HTTP {status}) GET {url} failed, {e}")
 
@@ -59,18 +111,61 @@ class Utility:
 
                 sleep(10)
 
-                return Utility.GET(self, url, raw, True)
+                return Utility.Fetch(self, url, True)
 
             logger.error(f"GET {url} failed, {e}")
 
             return
 
-        logger.trace(data)
+        logger.trace(res.text)
 
-        if raw is True:
-            return res.content
+        return res
+
+    def CacheResponse(self: Any, url: str, body: Tuple[bytes, Optional[str]]) -> None:
+        """
+        Store the provided response body in the run cache, evicting the least
+        recently used entries to remain within the byte budget. The caller
+        must hold the cache lock.
+        """
+
+        cache: Dict[str, Any] = self.cache
+        responses: OrderedDict[str, Tuple[bytes, Optional[str]]] = cache["responses"]
+        size: int = len(body[0])
+
+        if cache["limit"] == 0:
+            return
+        elif size > cache["limit"]:
+            logger.debug(f"Response for {url} exceeds cache limit, not cached")
+
+            return
+
+        while (cache["size"] + size) > cache["limit"]:
+            _, evicted = responses.popitem(last=False)
+            cache["size"] -= len(evicted[0])
+
+        responses[url] = body
+        cache["size"] += size
+
+    def CreateCache(self: Any) -> Dict[str, Any]:
+        """
+        Return an empty response cache bounded to the configured size in
+        megabytes.
+        """
+
+        size: Any = self.config.get("cacheSize", 64)
+
+        if (type(size) not in (int, float)) or (not isfinite(size)) or (size < 0):
+            logger.error(f"Invalid cacheSize {size}, defaulting to 64")
+
+            size = 64
 
-        return data
+        return {
+            "responses": OrderedDict(),
+            "pending": {},
+            "size": 0,
+            "limit": int(size * 1024 * 1024),
+            "lock": Lock(),
+        }
 
     def POST(self: Any, url: str, payload: Dict[str, Any]) -> bool:
         """Perform an HTTP POST request and return its status."""